@@ -1,10 +1,11 @@
 from ._logger import logger, set_logger
-from .convert_file import convert_file
+from .convert_file import convert_file, convert_files
 from .VERSION import __version__
 
 __version__ = __version__
 __all__ = [
     "convert_file",
+    "convert_files",
     "logger",
     "set_logger",
 ]
@@ -4,20 +4,29 @@ from typing import Any
 
 
 class LoggerProxy:
+    __slots__ = ("_logger", "_methods")
+
     def __init__(self):
         self._logger = None
+        self._methods: dict[str, Callable] = {}
 
     def set_logger(self, logger: Any) -> None:
         self._logger = logger
+        self._methods.clear()
 
     def _add_basic_logger(self) -> None:
         logging.basicConfig()
         self._logger = logging.getLogger("ebook2text")
 
     def __getattr__(self, name: str) -> Callable:
+        if method := self._methods.get(name):
+            return method
         if self._logger is None:
             self._add_basic_logger()
-        return getattr(self._logger, name)
+        attr = getattr(self._logger, name)
+        if callable(attr):
+            self._methods[name] = attr
+        return attr
 
 
 logger = LoggerProxy()
@@ -1,14 +1,19 @@
-from bs4.element import ResultSet, Tag
-from docx.document import Document
-from docx.text.paragraph import Paragraph
-from ebooklib.epub import EpubBook, EpubItem
-from pdfminer.layout import LTChar, LTContainer, LTItem, LTPage, LTText
-from pdfminer.pdftypes import PDFStream
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from docx.document import Document
+    from docx.text.paragraph import Paragraph
+    from ebooklib.epub import EpubBook, EpubItem
+    from lxml.html import HtmlElement
+    from pdfminer.layout import LTChar, LTContainer, LTItem, LTPage, LTText
+    from pdfminer.pdftypes import PDFStream
 
 __all__ = [
     "Document",
     "EpubBook",
     "EpubItem",
+    "HtmlElement",
     "LTChar",
     "LTContainer",
     "LTItem",
@@ -16,6 +21,28 @@ __all__ = [
     "LTPage",
     "Paragraph",
     "PDFStream",
-    "ResultSet",
-    "Tag",
 ]
+
+# Each type is imported from its library on first access, so a converter
+# only loads the parsing library it actually uses.
+_TYPE_MODULES = {
+    "Document": "docx.document",
+    "EpubBook": "ebooklib.epub",
+    "EpubItem": "ebooklib.epub",
+    "HtmlElement": "lxml.html",
+    "LTChar": "pdfminer.layout",
+    "LTContainer": "pdfminer.layout",
+    "LTItem": "pdfminer.layout",
+    "LTText": "pdfminer.layout",
+    "LTPage": "pdfminer.layout",
+    "Paragraph": "docx.text.paragraph",
+    "PDFStream": "pdfminer.pdftypes",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _TYPE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_TYPE_MODULES[name]), name)
+    globals()[name] = value
+    return value
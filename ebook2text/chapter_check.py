@@ -1,48 +1,54 @@
-NOT_CHAPTER = {
-    "about",
-    "acknowledgements",
-    "afterward",
-    "annotation",
-    "appendix",
-    "assessment",
-    "backmatter",
-    "bibliography",
-    "colophon",
-    "conclusion",
-    "contents",
-    "contributors",
-    "copyright",
-    "cover",
-    "credits",
-    "dedication",
-    "division",
-    "endnotes",
-    "epigraph",
-    "errata",
-    "footnotes",
-    "forward",
-    "frontmatter",
-    "glossary",
-    "imprintur",
-    "imprint",
-    "index",
-    "introduction",
-    "landmarks",
-    "list",
-    "notice",
-    "page",
-    "preamble",
-    "preface",
-    "prologue",
-    "question",
-    "rear",
-    "revision",
-    "sign up",
-    "table",
-    "toc",
-    "volume",
-    "warning",
-}
+from functools import lru_cache
+
+NOT_CHAPTER = frozenset(
+    {
+        "about",
+        "acknowledgements",
+        "afterward",
+        "annotation",
+        "appendix",
+        "assessment",
+        "backmatter",
+        "bibliography",
+        "colophon",
+        "conclusion",
+        "contents",
+        "contributors",
+        "copyright",
+        "cover",
+        "credits",
+        "dedication",
+        "division",
+        "endnotes",
+        "epigraph",
+        "errata",
+        "footnotes",
+        "forward",
+        "frontmatter",
+        "glossary",
+        "imprintur",
+        "imprint",
+        "index",
+        "introduction",
+        "landmarks",
+        "list",
+        "notice",
+        "page",
+        "preamble",
+        "preface",
+        "prologue",
+        "question",
+        "rear",
+        "revision",
+        "sign up",
+        "table",
+        "toc",
+        "volume",
+        "warning",
+    }
+)
+# str.startswith checks every prefix in one C-level call.
+NOT_CHAPTER_PREFIXES = tuple(NOT_CHAPTER)
 
 
 def roman_to_int(roman_num: str) -> int:
@@ -198,6 +204,15 @@ def is_number(s: str) -> bool:
     return s.isdigit() or is_roman_numeral(s) or is_spelled_out_number(s)
 
 
+@lru_cache(maxsize=1024)
+def _is_number_word(word: str) -> bool:
+    """
+    Cached is_number for single word heading candidates, which repeat
+    across a book.
+    """
+    return is_number(word)
+
+
 def is_chapter(s: str) -> bool:
     """
     Check if a string contains the word "chapter", a Roman numeral, a
@@ -207,9 +222,10 @@ def is_chapter(s: str) -> bool:
     Returns bool: True if the string meets the criteria, False otherwise.
     """
     lower_s = s.lower().strip()
-    return lower_s.startswith("chapter") or (
-        len(lower_s.split()) == 1 and is_number(lower_s)
-    )
+    if lower_s.startswith("chapter"):
+        return True
+    words = lower_s.split(maxsplit=1)
+    return len(words) == 1 and _is_number_word(words[0])
 
 
 def is_not_chapter(paragraph: str, metadata: dict) -> bool:
@@ -219,9 +235,6 @@ def is_not_chapter(paragraph: str, metadata: dict) -> bool:
     title = metadata.get("title", "no title found")
     author = metadata.get("author", "no author found")
     paragraph = paragraph.lower()
-    return any(
-        paragraph.startswith(title.lower())
-        or paragraph.startswith(author.lower())
-        or paragraph.startswith(not_chapter_word)
-        for not_chapter_word in NOT_CHAPTER
-    )
+    return paragraph.startswith(
+        (title.lower(), author.lower())
+    ) or paragraph.startswith(NOT_CHAPTER_PREFIXES)
@@ -1,15 +1,30 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib import import_module
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Union
 
-from ebook2text.docx_conversion import DocxConverter, initialize_docx_converter
-from ebook2text.epub_conversion import EpubConverter, initialize_epub_converter
-from ebook2text.pdf_conversion import PDFConverter, initialize_pdf_converter
 from ebook2text.text_parser import TextParser
 
+if TYPE_CHECKING:
+    from ebook2text.docx_conversion import DocxConverter
+    from ebook2text.epub_conversion import EpubConverter
+    from ebook2text.pdf_conversion import PDFConverter
+
+FILE_NAME_TABLE = str.maketrans(" -.", "___")
+# Converter packages pull in heavy parsing libraries, so they are only
+# imported when a file of their type is converted.
+CONVERTER_INITIALIZERS: dict = {
+    ".epub": ("ebook2text.epub_conversion", "initialize_epub_converter"),
+    ".pdf": ("ebook2text.pdf_conversion", "initialize_pdf_converter"),
+    ".docx": ("ebook2text.docx_conversion", "initialize_docx_converter"),
+}
+TEXT_EXTENSIONS = frozenset({".txt", ".text"})
+
 
 def _initialize_converter(
     file_path: Path, metadata: dict, extension: str
-) -> Union[DocxConverter, EpubConverter, PDFConverter, TextParser]:
+) -> Union["DocxConverter", "EpubConverter", "PDFConverter", TextParser]:
     """
     Initialize the appropriate converter based on the file extension.
 
@@ -25,23 +40,19 @@ def _initialize_converter(
     Raises:
         ValueError: If the file type is not supported.
     """
-    if extension == ".epub":
-        return initialize_epub_converter(file_path, metadata)
-    elif extension == ".pdf":
-        return initialize_pdf_converter(file_path, metadata)
-    elif extension == ".docx":
-        return initialize_docx_converter(file_path, metadata)
-    elif extension in {".txt", ".text"}:
+    if extension in TEXT_EXTENSIONS:
         return TextParser(file_path)
-    raise ValueError(f"Unsupported file type: {extension}")
+    if extension not in CONVERTER_INITIALIZERS:
+        raise ValueError(f"Unsupported file type: {extension}")
+    module_name, initializer_name = CONVERTER_INITIALIZERS[extension]
+    initializer = getattr(import_module(module_name), initializer_name)
+    return initializer(file_path, metadata)
 
 
 def _parse_file_path(file_path: Path) -> Path:
     """Create the text file name from the book file name."""
     folder = file_path.parent
-    book_name = (
-        file_path.stem.replace(" ", "_").replace("-", "_").replace(".", "_")
-    )
+    book_name = file_path.stem.translate(FILE_NAME_TABLE)
     almost_path = folder / book_name
     return almost_path.with_suffix(".txt")
 
@@ -74,7 +85,42 @@ def convert_file(
         return converter.return_string(converter.parse_file())
 
     save_path = save_path or _parse_file_path(file_path)
-    for content in converter.parse_file():
-        if content:
-            converter.write_text(content, save_path)
+    converter.write_file(converter.parse_file(), save_path)
     return
+
+
+def _convert_book(
+    book: Tuple[Path, dict], save_file: bool
+) -> Union[str, None]:
+    """Unpack a (file path, metadata) pair for `convert_file`."""
+    file_path, metadata = book
+    return convert_file(file_path, metadata, save_file=save_file)
+
+
+def convert_files(
+    books: Iterable[Tuple[Path, dict]],
+    *,
+    save_file: bool = True,
+    max_workers: Union[int, None] = None,
+) -> List[Union[str, None]]:
+    """
+    Converts several books in parallel, one book per worker process.
+
+    Args:
+        books: Pairs of the path to a book file and its metadata dictionary.
+        save_file: Boolean to save the files or not. Saved files use the
+            same base name as the book file, in the same directory.
+        max_workers: (Optional) Number of worker processes. Defaults to the
+            number of CPUs.
+
+    Returns:
+        A list with the result of `convert_file` for each book, in the same
+            order as `books`.
+
+    Raises:
+        ValueError: If a file type is not supported (inherited from
+            convert_file).
+    """
+    convert_book = partial(_convert_book, save_file=save_file)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(convert_book, books))
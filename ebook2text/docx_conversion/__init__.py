@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Generator
+from typing import BinaryIO, Generator, Union
 
 from ebook2text.docx_conversion.docx_converter import DocxConverter
 from ebook2text.docx_conversion.docx_image_extractor import DocxImageExtractor
@@ -15,7 +15,7 @@ __all__ = [
 
 
 def initialize_docx_converter(
-    file_path: Path, metadata: dict
+    file_path: Union[Path, bytes, BinaryIO], metadata: dict
 ) -> DocxConverter:
     image_extractor = DocxImageExtractor()
     text_extractor = DocxTextExtractor(image_extractor)
@@ -23,14 +23,15 @@ def initialize_docx_converter(
 
 
 def convert_docx(
-    file_path: Path, metadata: dict
+    file_path: Union[Path, bytes, BinaryIO], metadata: dict
 ) -> Generator[str, None, None]:
     """
     A convenience function that reads the contents of a DOCX file and returns
     the processed text.
 
     Args:
-        file_path (str): The path to the DOCX file.
+        file_path (str): The path to the DOCX file, or its contents as bytes
+            or a binary file object.
         metadata (dict): Metadata about the document.
 
     Returns:
@@ -1,32 +1,59 @@
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
-from typing import Generator, Tuple
+from typing import BinaryIO, Generator, Tuple, Union
 
 import docx
 from docx.oxml.exceptions import XmlchemyError
+from docx.oxml.ns import qn
+from lxml import etree
 
 from ebook2text._exceptions import DocxConversionError
 from ebook2text._logger import logger
 from ebook2text._types import Paragraph
 from ebook2text.chapter_check import is_chapter, is_not_chapter
+from ebook2text.docx_conversion._namespaces import docx_ns_map
 from ebook2text.docx_conversion.docx_text_extractor import DocxTextExtractor
 from ebook2text.text_utilities import desmarten_text
 
+HAS_PAGE_BREAK = etree.XPath(
+    "boolean(w:pPr/w:pageBreakBefore | .//w:br[@w:type='page'])",
+    namespaces=docx_ns_map,
+)
+HAS_PAGE_BREAK_BEFORE = etree.XPath(
+    "boolean(w:pPr/w:pageBreakBefore)", namespaces=docx_ns_map
+)
+TEXT_TAG = qn("w:t")
+BREAK_TAG = qn("w:br")
+BREAK_TYPE_ATTR = qn("w:type")
+
 
 class DocxConverter:
     """
     Class to convert a Word document to structured text.
 
     Attributes:
-        file_path (str): The path to the Word document.
+        file_path (str): The path to the Word document, or its contents as
+            bytes or a binary file object.
         metadata (dict): Metadata related to the document.
         doc (Document): The parsed Word document object.
         paragraphs (list): List of paragraphs objects extracted from the
             document.
     """
 
+    __slots__ = (
+        "_chapter_separator",
+        "_extraction_window",
+        "_max_lines_to_check",
+        "metadata",
+        "non_chapter",
+        "paragraphs",
+        "text_extractor",
+    )
+
     def __init__(
         self,
-        file_path: Path,
+        file_path: Union[Path, bytes, BinaryIO],
         metadata: dict,
         text_extractor: DocxTextExtractor,
     ):
@@ -41,23 +68,50 @@ class DocxConverter:
 
         self._chapter_separator: str = "***"
         self._max_lines_to_check: int = 6
+        self._extraction_window: int = 16
 
         self.non_chapter: bool = False
 
-    def _read_file(self, file_path: Path) -> Generator[Paragraph, None, None]:
+    def _read_file(
+        self, file_path: Union[Path, bytes, BinaryIO]
+    ) -> Generator[Paragraph, None, None]:
         """
-        Reads a Word document from the specified file path.
+        Reads a Word document from the specified file path. Documents already
+        in memory can be passed as bytes or a binary file object instead, and
+        are read without touching the filesystem.
+
+        Paragraph objects are created one at a time as the body is walked,
+        rather than building the full `Document.paragraphs` list up front.
 
         Returns:
             Generator[Paragraph]: A generator of paragraph objects extracted
                 from the Word document object.
         """
         try:
-            yield from docx.Document(file_path).paragraphs
+            if isinstance(file_path, (bytes, bytearray)):
+                file_path = BytesIO(file_path)
+            document = docx.Document(file_path)
+            self.text_extractor.index_document(document.part)
+            for p_element in document.element.body.iterchildren(qn("w:p")):
+                yield Paragraph(p_element, document)
         except (OSError, ValueError, XmlchemyError) as e:
             logger.error(f"Error reading Word document: {e}")
             raise DocxConversionError from e
 
+    def _extract_paragraph_text(
+        self,
+    ) -> Generator[Tuple[Paragraph, str], None, None]:
+        """
+        Yields each paragraph with its extracted text. Paragraphs are read a
+        window at a time so the OCR of all images in the window runs
+        concurrently.
+
+        Yields:
+            Tuple[Paragraph, str]: The paragraph and its extracted text.
+        """
+        while window := list(islice(self.paragraphs, self._extraction_window)):
+            yield from zip(window, self.text_extractor.extract_texts(window))
+
     def parse_file(self) -> Generator[str, None, None]:
         """
         Process paragraphs to organize them into pages and chapters, handling
@@ -66,26 +120,36 @@ class DocxConverter:
 
         Returns:
             str: The structured text of the entire book.
+
+        Note:
+            Methods used for every paragraph are bound to locals before the
+            loop. The header window and non-chapter checks are left to
+            `_process_text`.
         """
         current_page: list = []
         current_para_index: int = 0
+        page_breaks = self._page_breaks
+        page_break_after: bool = False
+        process_text = self._process_text
 
-        for paragraph in self.paragraphs:
-            paragraph_text = self.text_extractor.extract_text(paragraph)
+        for paragraph, paragraph_text in self._extract_paragraph_text():
             current_para_index += 1
 
-            if self._contains_page_break(paragraph):
+            page_break_before, next_page_break = page_breaks(paragraph)
+            if page_break_before or page_break_after:
                 if current_page:
                     yield "\n".join(current_page)
                 current_page = []
                 current_para_index = 0
+            page_break_after = next_page_break
 
-            if paragraph_text:
-                (processed_text, current_para_index) = self._process_text(
-                    paragraph_text, current_para_index
-                )
-                if processed_text:
-                    current_page.append(processed_text)
+            if not paragraph_text:
+                continue
+            (processed_text, current_para_index) = process_text(
+                paragraph_text, current_para_index
+            )
+            if processed_text:
+                current_page.append(processed_text)
 
         if current_page:
             yield "\n".join(current_page)
@@ -108,7 +172,7 @@ class DocxConverter:
         return (
             text
             if output_path.exists()
-            else text.lstrip(self._chapter_separator)
+            else text.removeprefix(self._chapter_separator)
         )
 
     def write_text(self, content: str, output_path: Path) -> None:
@@ -123,6 +187,27 @@ class DocxConverter:
         with output_path.open("a", encoding="utf-8") as f:
             f.write(cleaned_content + "\n")
 
+    def write_file(
+        self, generator: Generator[str, None, None], output_path: Path
+    ) -> None:
+        """
+        Write all of the parsed text to a file, opening it only once.
+
+        Args:
+            generator (Generator[str, None, None]): The content generator
+                that yields the text. This is usually the `parse_file` method.
+            output_path (Path): The path to the output file.
+        """
+        is_new_file = not output_path.exists()
+        with output_path.open("a", encoding="utf-8") as f:
+            for content in generator:
+                if not content:
+                    continue
+                if is_new_file:
+                    content = content.removeprefix(self._chapter_separator)
+                    is_new_file = False
+                f.write(content + "\n")
+
     def return_string(self, generator: Generator[str, None, None]) -> str:
         """
         Return the parsed text as a string.
@@ -133,10 +218,14 @@ class DocxConverter:
 
         Returns:
             str: The parsed text as a single string.
+
+        Note:
+            The leading chapter separator is stripped from the first page
+            before joining, so the joined text is only built once.
         """
-        return "\n".join(line for line in generator if line.strip()).lstrip(
-            self._chapter_separator
-        )
+        pages = (page for page in generator if page.strip())
+        first_page: str = next(pages, "").removeprefix(self._chapter_separator)
+        return "\n".join((first_page, *pages))
 
     @staticmethod
     def _remove_smart_punctuation(text: str) -> str:
@@ -153,17 +242,44 @@ class DocxConverter:
 
     def _contains_page_break(self, paragraph: Paragraph) -> bool:
         """
-        Checks if a given paragraph contains a page break.
+        Checks if a given paragraph contains a page break, either as a
+        page break before the paragraph or as a manual page break in a run.
+        Rendered page breaks depend on layout and are not counted.
         Args:
             paragraph: The Paragraph object containing the text and formatting
         Returns:
             bool: True if the paragraph contains a page break, False otherwise
         """
+        return HAS_PAGE_BREAK(paragraph._element)
+
+    def _page_breaks(self, paragraph: Paragraph) -> Tuple[bool, bool]:
+        """
+        Checks where the page breaks of a paragraph fall relative to its
+        text. A manual page break after the text, as Word inserts for
+        Ctrl+Enter at the end of a line, starts the new page with the next
+        paragraph instead of this one.
+
+        Args:
+            paragraph: The Paragraph object containing the text and formatting
+        Returns:
+            Tuple[bool, bool]: Whether a page break comes before the text of
+                the paragraph, and whether one comes after it.
+        """
+        if not self._contains_page_break(paragraph):
+            return False, False
         p_element = paragraph._element
-        return (
-            p_element.pPr is not None
-            and p_element.pPr.pageBreakBefore is not None
-        )
+        before: bool = HAS_PAGE_BREAK_BEFORE(p_element)
+        after: bool = False
+        has_text: bool = False
+        for element in p_element.iter(TEXT_TAG, BREAK_TAG):
+            if element.tag == TEXT_TAG:
+                has_text = has_text or bool(element.text)
+            elif element.get(BREAK_TYPE_ATTR) == "page":
+                if has_text:
+                    after = True
+                else:
+                    before = True
+        return before, after
 
     def _check_index(self, index: int) -> bool:
         """
@@ -179,36 +295,6 @@ class DocxConverter:
         """
         return index >= self._max_lines_to_check
 
-    def _is_start_of_chapter(self, text: str, index: int) -> bool:
-        """
-        Checks if the given text marks the start of a new chapter based on
-        specific criteria.
-
-        Args:
-            text (str): The text to be checked for chapter header indicators.
-            index (int): The number of paragraphs since the last page break.
-
-        Returns:
-            bool: True if the text is considered the start of a chapter, False
-                otherwise.
-        """
-        return False if self._check_index(index) else is_chapter(text)
-
-    def _is_non_chapter(self, text: str, index: int) -> bool:
-        """
-        Checks if the given text is not a chapter based on specific criteria.
-
-        Args:
-            text (str): The text to be checked for being front or back matter.
-            index (int): The paragraph index of the text within the chapter.
-
-        Returns:
-            bool: True if the text is not a chapter, False otherwise.
-        """
-        if self._check_index(index):
-            return False
-        return is_not_chapter(text, self.metadata)
-
     def _process_text(
         self, paragraph_text: str, current_para_index: int
     ) -> Tuple[str, int]:
@@ -224,17 +310,22 @@ class DocxConverter:
         Returns:
             Tuple[str, int]: A tuple containing the processed text and the
                 updated index of the paragraph within its chapter.
-        """
 
-        if self._is_start_of_chapter(paragraph_text, current_para_index):
-            current_para_index = 0
-            processed_text = self._chapter_separator
-            self.non_chapter = False
-        elif self._is_non_chapter(paragraph_text, current_para_index):
-            processed_text = ""
-            self.non_chapter = True
-        elif self.non_chapter:
-            processed_text = ""
-        else:
-            processed_text = self._remove_smart_punctuation(paragraph_text)
+        Note:
+            The index is checked once, and the chapter and non-chapter checks
+            only run for paragraphs inside the chapter header window.
+        """
+        if not self._check_index(current_para_index):
+            if is_chapter(paragraph_text):
+                self.non_chapter = False
+                return self._chapter_separator, 0
+            if is_not_chapter(paragraph_text, self.metadata):
+                self.non_chapter = True
+                return "", current_para_index
+
+        processed_text = (
+            ""
+            if self.non_chapter
+            else self._remove_smart_punctuation(paragraph_text)
+        )
         return processed_text, current_para_index
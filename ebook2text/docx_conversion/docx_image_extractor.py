@@ -1,9 +1,18 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional
+
+from lxml import etree
 
 from ebook2text import logger
 from ebook2text._types import Paragraph
 from ebook2text.docx_conversion._namespaces import docx_ns_map
-from ebook2text.ocr import encode_image_bytes
+from ebook2text.ocr import encode_image_bytes, is_too_small_for_ocr
+
+BLIP_TAG = f"{{{docx_ns_map['a']}}}blip"
+EMBED_ATTR = f"{{{docx_ns_map['r']}}}embed"
+IMAGE_PARAGRAPHS = etree.XPath("//w:p[.//a:blip]", namespaces=docx_ns_map)
+HAS_DRAWING = etree.XPath(
+    "boolean(.//w:drawing | .//w:pict)", namespaces=docx_ns_map
+)
 
 
 class DocxImageExtractor:
@@ -11,6 +20,60 @@ class DocxImageExtractor:
     A class dedicated to extracting images from docx Paragraph objects.
     """
 
+    def __init__(self):
+        self._blips_by_paragraph: Optional[Dict[etree._Element, list]] = None
+        self._related_parts: Optional[dict] = None
+        self._indexed_part = None
+
+    def index_document(self, document_part) -> None:
+        """
+        Finds the images of every paragraph in the document with a single
+        XPath sweep, so paragraphs without images are skipped without
+        searching them. The document's relationships are kept so images are
+        resolved without going through each paragraph's part. The index is
+        only used for paragraphs of the indexed document.
+
+        Args:
+            document_part: The main document part of the Word document.
+        """
+        self._blips_by_paragraph = {
+            p_element: list(p_element.iter(BLIP_TAG))
+            for p_element in IMAGE_PARAGRAPHS(document_part.element)
+        }
+        self._related_parts = document_part.related_parts
+        self._indexed_part = document_part
+
+    def _is_indexed(self, paragraph: Paragraph) -> bool:
+        """
+        Checks whether the paragraph belongs to the indexed document.
+        """
+        return (
+            self._blips_by_paragraph is not None
+            and paragraph.part is self._indexed_part
+        )
+
+    def has_images(self, paragraph: Paragraph) -> bool:
+        """
+        Checks whether the paragraph may contain images, without extracting
+        them. Uses the document index if one was built, otherwise looks for
+        drawing or picture elements.
+
+        Returns:
+            bool: True if the paragraph may contain images, False otherwise.
+        """
+        if self._is_indexed(paragraph):
+            return paragraph._p in self._blips_by_paragraph
+        return HAS_DRAWING(paragraph._p)
+
+    def _find_blips(self, paragraph: Paragraph) -> Iterable:
+        """
+        Returns the blip elements of the paragraph, from the document index
+        if one was built for its document.
+        """
+        if not self._is_indexed(paragraph):
+            return paragraph._p.iter(BLIP_TAG)
+        return self._blips_by_paragraph.get(paragraph._p, [])
+
     def extract_images(self, paragraph: Paragraph) -> List[str]:
         """
         Extracts and converts images found in the paragraph into
@@ -25,7 +88,8 @@ class DocxImageExtractor:
 
     def _build_base64_images_list(self, image_streams: list) -> list:
         """
-        Converts image blobs to base64-encoded strings.
+        Converts image blobs to base64-encoded strings, leaving out images
+        too small to hold text.
 
         Args:
             image_blobs (list): A list of extracted image streams.
@@ -33,7 +97,11 @@ class DocxImageExtractor:
         Returns:
             list: A list of base64-encoded strings representing the images.
         """
-        return [encode_image_bytes(image) for image in image_streams]
+        return [
+            encode_image_bytes(image)
+            for image in image_streams
+            if not is_too_small_for_ocr(image)
+        ]
 
     def _extract_image_blobs(self, paragraph: Paragraph) -> list:
         """
@@ -42,17 +110,24 @@ class DocxImageExtractor:
         Returns:
             list: A list of image blobs extracted from the paragraph.
         """
-        namespace: dict = docx_ns_map
         image_blobs: list = []
+        related_parts: Optional[dict] = (
+            self._related_parts if self._is_indexed(paragraph) else None
+        )
 
-        blips = paragraph._p.findall(".//a:blip", namespaces=namespace)
-        for blip in blips:
+        for blip in self._find_blips(paragraph):
+            rId = blip.get(EMBED_ATTR)
+            if not rId:
+                # Linked images are stored outside the document.
+                continue
+            if related_parts is None:
+                related_parts = paragraph.part.related_parts
+            image_part = related_parts.get(rId)
+            if image_part is None:
+                logger.warning(f"Missing image relationship: {rId}")
+                continue
             try:
-                rId = blip.attrib[f"{{{namespace['r']}}}embed"]
-                image_part = paragraph.part.related_parts[rId]
-                blob = image_part.blob
-                image_blobs.append(blob)
-            except (KeyError, ValueError, AttributeError) as e:
+                image_blobs.append(image_part.blob)
+            except ValueError as e:
                 logger.exception(f"Corrupted image data: {str(e)}")
-                continue
         return image_blobs
@@ -1,6 +1,15 @@
+from typing import List
+
+from lxml import etree
+
 from ebook2text._types import Paragraph
+from ebook2text.docx_conversion._namespaces import docx_ns_map
 from ebook2text.docx_conversion.docx_image_extractor import DocxImageExtractor
-from ebook2text.ocr import run_ocr
+from ebook2text.ocr import run_ocr, run_ocr_batch
+
+HAS_TEXT = etree.XPath(
+    "boolean(.//w:t | .//w:noBreakHyphen)", namespaces=docx_ns_map
+)
 
 
 class DocxTextExtractor:
@@ -8,9 +17,20 @@ class DocxTextExtractor:
     Class dedicated to extracting and processing text from docx Paragraphs.
     """
 
+    __slots__ = ("image_extractor",)
+
     def __init__(self, image_extractor: DocxImageExtractor):
         self.image_extractor = image_extractor
 
+    def index_document(self, document_part) -> None:
+        """
+        Indexes the images of the whole document ahead of extraction.
+
+        Args:
+            document_part: The main document part of the Word document.
+        """
+        self.image_extractor.index_document(document_part)
+
     def extract_text(self, paragraph: Paragraph) -> str:
         """
         Extracts the text content from the paragraph, performs OCR on any
@@ -22,14 +42,54 @@ class DocxTextExtractor:
         Returns:
             str: The extracted and processed text.
         """
-        ocr_text = self._extract_image_text(paragraph)
-        paragraph_text = paragraph.text.strip()
-        return ocr_text or paragraph_text
+        return self._extract_image_text(paragraph) or self._paragraph_text(
+            paragraph
+        )
+
+    def extract_texts(self, paragraphs: List[Paragraph]) -> List[str]:
+        """
+        Extracts the text content from several paragraphs, sending the OCR
+        requests for every paragraph with images at the same time.
+
+        Args:
+            paragraphs: The Paragraph objects to extract text from.
+
+        Returns:
+            List[str]: The extracted and processed text of each paragraph, in
+                order.
+        """
+        image_lists: list = [
+            self.image_extractor.extract_images(paragraph)
+            if self.image_extractor.has_images(paragraph)
+            else []
+            for paragraph in paragraphs
+        ]
+        ocr_texts = iter(
+            run_ocr_batch([images for images in image_lists if images])
+        )
+        return [
+            (next(ocr_texts) if images else "")
+            or self._paragraph_text(paragraph)
+            for paragraph, images in zip(paragraphs, image_lists)
+        ]
 
     def _extract_image_text(self, paragraph: Paragraph) -> str:
         """
         Extracts text from images within the paragraph using OCR.
         """
+        if not self.image_extractor.has_images(paragraph):
+            return ""
         if base64_images := self.image_extractor.extract_images(paragraph):
             return run_ocr(base64_images)
         return ""
+
+    @staticmethod
+    def _paragraph_text(paragraph: Paragraph) -> str:
+        """
+        Returns the stripped text of the paragraph. Empty spacer paragraphs
+        are detected with a single XPath probe and skip python-docx's run
+        walk.
+        """
+        if not HAS_TEXT(paragraph._p):
+            return ""
+        return paragraph.text.strip()
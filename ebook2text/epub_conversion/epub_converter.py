@@ -1,18 +1,47 @@
+import codecs
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 
 import ebooklib
-from bs4 import BeautifulSoup
+import lxml.html
 from ebooklib import epub
 from ebooklib.epub import EpubException
+from lxml import etree
 
 from ebook2text import logger
 from ebook2text._exceptions import EpubConversionError
-from ebook2text._types import EpubBook, EpubItem, ResultSet, Tag
+from ebook2text._types import EpubBook, EpubItem
 from ebook2text.chapter_check import NOT_CHAPTER, is_chapter, is_not_chapter
 from ebook2text.epub_conversion.epub_text_extractor import EpubTextExtractor
 from ebook2text.text_utilities import desmarten_text
 
+EPUB_READ_BUFFER_SIZE = 1 << 15
+TEXT_ELEMENTS = ("p", "img", "h1", "h2", "h3", "h4", "h5", "h6")
+XML_ENCODING = re.compile(rb"""\s*<\?xml[^>]*?encoding=["']([\w.-]+)["']""")
+
+
+def _chapter_encoding(content: bytes) -> str:
+    """
+    Returns the encoding of an XHTML chapter.
+
+    EPUB chapters are XML, which is UTF-8 unless a byte order mark or the
+    XML declaration says otherwise. The HTML parser would fall back to
+    Latin-1 instead, so the encoding is passed to it explicitly.
+    """
+    if content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    match = XML_ENCODING.match(content)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+    return "utf-8"
+
 
 class EpubConverter:
     """
@@ -40,10 +69,22 @@ class EpubConverter:
         _clean_text(text): Cleans the extracted text.
         parse_file(): Splits the EPUB file into chapters and returns the
             cleaned text.
+        parse_file_threaded(max_workers): Like parse_file, but processes
+            several chapters at once.
         write_text(content, file_path): Writes the parsed text to a file.
+        write_file(generator, file_path): Writes all of the parsed text to a
+            file, opening it only once.
         return_string(generator): Returns the parsed text as a string.
     """
 
+    __slots__ = (
+        "_chapter_separator",
+        "epub_book",
+        "max_lines_to_check",
+        "metadata",
+        "text_extractor",
+    )
+
     def __init__(
         self,
         file_path: Path,
@@ -57,9 +98,24 @@ class EpubConverter:
         self.max_lines_to_check = 6
 
     def _read_file(self, file_path: Path) -> EpubBook:
-        """Reads Epub file from the file path using Ebooklib package"""
+        """
+        Reads Epub file from the file path using Ebooklib package.
+
+        The archive is read through a single handle with a larger buffer, so
+        the zip directory and entries are not read in small chunks.
+        Unpacked EPUB directories are passed to Ebooklib as they are.
+        """
+        options = {"ignore_ncx": True}
         try:
-            return epub.read_epub(file_path, options={"ignore_ncx": True})
+            try:
+                epub_file = open(
+                    file_path, "rb", buffering=EPUB_READ_BUFFER_SIZE
+                )
+            except (IsADirectoryError, PermissionError):
+                # Unpacked EPUB directories are read by Ebooklib itself.
+                return epub.read_epub(file_path, options=options)
+            with epub_file:
+                return epub.read_epub(epub_file, options=options)
         except EpubException as e:
             logger.error(f"Error reading EPUB file: {e}")
             raise EpubConversionError from e
@@ -81,21 +137,33 @@ class EpubConverter:
 
         Returns:
             str: String containing the text of the chapter.
+
+        Note:
+            The chapter is parsed with lxml.html and its text elements are
+            walked in document order by a single iterator. Only the header
+            elements are checked for a chapter heading; the same iterator
+            then yields the rest of the chapter.
         """
-        TEXT_ELEMENTS = ["p", "img", "h1", "h2", "h3", "h4", "h5", "h6"]
-        soup = BeautifulSoup(item.content, "html.parser")
-        elements: ResultSet[Tag] = soup.find_all(TEXT_ELEMENTS)
+        content: bytes = item.content
+        # One parser per chapter, so parse_file_threaded never shares one.
+        parser = lxml.html.HTMLParser(encoding=_chapter_encoding(content))
+        try:
+            root = lxml.html.fromstring(content, parser=parser)
+        except etree.ParserError:
+            return ""
+        elements = root.iter(*TEXT_ELEMENTS)
 
-        for i, element in enumerate(elements[: self.max_lines_to_check]):
-            text = self.text_extractor.extract_text(element, self.epub_book)
-            if any(word in NOT_CHAPTER for word in text.split()):
+        for element in islice(elements, self.max_lines_to_check):
+            text = self.text_extractor.extract_text(
+                element, self.epub_book, item.file_name
+            )
+            if not NOT_CHAPTER.isdisjoint(text.split()):
                 return ""
             elif is_chapter(text):
-                starting_line = i + 1
                 return "\n".join(
-                    tag.get_text().strip()
-                    for tag in elements[starting_line:]
-                    if tag != "img"
+                    tag.text_content().strip()
+                    for tag in elements
+                    if tag.tag != "img"
                 )
         return ""
 
@@ -114,13 +182,47 @@ class EpubConverter:
                 separator.
         """
         for item in self._get_items():
-            if (
-                item.get_type() == ebooklib.ITEM_DOCUMENT
-                and not is_not_chapter(item.file_name.lower(), self.metadata)
-            ):
+            if self._is_chapter_item(item):
                 if chapter_text := self._process_chapter_text(item):
                     yield self.clean_text(chapter_text)
 
+    def parse_file_threaded(
+        self, max_workers: Optional[int] = None
+    ) -> Generator[str, None, None]:
+        """
+        Split the EPUB file into chapters and return the cleaned text, like
+        `parse_file`, but process several chapters at once so the OCR
+        requests of different chapters overlap.
+
+        Args:
+            max_workers (int, optional): The number of chapters processed at
+                once. Defaults to the smaller of 4 and the CPU count, since
+                parsing holds the GIL and more threads only add contention.
+
+        Returns:
+            str: The cleaned text of the chapters, in book order.
+        """
+        chapters = [
+            item for item in self._get_items() if self._is_chapter_item(item)
+        ]
+        workers = max_workers or min(4, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for chapter_text in executor.map(
+                self._process_chapter_text, chapters
+            ):
+                if chapter_text:
+                    yield self.clean_text(chapter_text)
+
+    def _is_chapter_item(self, item: EpubItem) -> bool:
+        """
+        Checks if an item is a document whose file name does not mark it as
+        front or back matter.
+        """
+        return (
+            item.get_type() == ebooklib.ITEM_DOCUMENT
+            and not is_not_chapter(item.file_name.lower(), self.metadata)
+        )
+
     def _clean_before_write(self, text: str, output_path: Path) -> str:
         """
         Strips the chapter separator from the text if the file does not exist.
@@ -139,7 +241,7 @@ class EpubConverter:
         return (
             text
             if output_path.exists()
-            else text.lstrip(self._chapter_separator)
+            else text.removeprefix(self._chapter_separator)
         )
 
     def write_text(self, content: str, output_path: Path) -> None:
@@ -154,6 +256,27 @@ class EpubConverter:
         with output_path.open("a", encoding="utf-8") as f:
             f.write(self._chapter_separator + cleaned_content)
 
+    def write_file(
+        self, generator: Generator[str, None, None], output_path: Path
+    ) -> None:
+        """
+        Write all of the parsed text to a file, opening it only once.
+
+        Args:
+            generator (Generator[str, None, None]): The content generator
+                that yields the text. This is usually the `parse_file` method.
+            output_path (Path): The path to the output file.
+        """
+        is_new_file = not output_path.exists()
+        with output_path.open("a", encoding="utf-8") as f:
+            for content in generator:
+                if not content:
+                    continue
+                if is_new_file:
+                    content = content.removeprefix(self._chapter_separator)
+                    is_new_file = False
+                f.write(self._chapter_separator + content)
+
     def return_string(self, generator: Generator[str, None, None]) -> str:
         """
         Return the parsed text as a string.
@@ -1,7 +1,10 @@
+import posixpath
 from typing import Optional
+from urllib.parse import unquote
 
-from ebook2text._types import EpubBook, Tag
-from ebook2text.ocr import encode_image_bytes, run_ocr
+from ebook2text import logger
+from ebook2text._types import EpubBook, EpubItem, HtmlElement
+from ebook2text.ocr import encode_image_bytes, is_too_small_for_ocr, run_ocr
 
 
 class EpubTextExtractor:
@@ -9,8 +12,18 @@ class EpubTextExtractor:
     Extracts text from EPUB elements, handling image OCR.
     """
 
+    __slots__ = ("_indexed_book", "_items_by_basename", "_items_by_name")
+
+    def __init__(self) -> None:
+        self._indexed_book: Optional[EpubBook] = None
+        self._items_by_name: dict = {}
+        self._items_by_basename: dict = {}
+
     def extract_text(
-        self, element: Tag, book: Optional[EpubBook] = None
+        self,
+        element: HtmlElement,
+        book: Optional[EpubBook] = None,
+        chapter_name: str = "",
     ) -> str:
         """
         Extracts text from an element, using OCR for images.
@@ -18,44 +31,105 @@ class EpubTextExtractor:
         Args:
             element: The element from which text needs to be extracted.
             book (EpubBook): The EpubBook object for accessing image data.
+            chapter_name (str): The file name of the chapter the element is
+                in, which image sources are relative to.
 
         Returns:
             str: The extracted text from the element.
         """
-        if element.name != "img":
+        if element.tag != "img":
             return self._extract_text(element)
         if not book:
             raise ValueError("Book is not provided")
-        return self._extract_image_text(element, book)
+        return self._extract_image_text(element, book, chapter_name)
 
-    def _get_image_file(self, element: Tag, book: EpubBook) -> list:
+    def _get_image_file(
+        self, element: HtmlElement, book: EpubBook, chapter_name: str = ""
+    ) -> list:
         """
         Extracts images from the EPUB file.
 
         Args:
             element: The element containing the image data.
+            chapter_name (str): The file name of the chapter the element is
+                in.
 
         Returns:
             list: A list of encoded image data.
         """
-        if element.name != "img":
+        if element.tag != "img":
             raise ValueError("Element is not an image")
-        image = book.get_item_with_id(element.get("src"))
-        return [encode_image_bytes(image.get_content())]
+        image = self._find_item(element.get("src", ""), book, chapter_name)
+        if image is None:
+            logger.warning(f"Image not found: {element.get('src')}")
+            return []
+        content: bytes = image.get_content()
+        if is_too_small_for_ocr(content):
+            logger.info(f"Image too small for OCR: {element.get('src')}")
+            return []
+        return [encode_image_bytes(content)]
+
+    def _find_item(
+        self, src: str, book: EpubBook, chapter_name: str = ""
+    ) -> Optional[EpubItem]:
+        """
+        Finds the book item an image source refers to.
 
-    def _extract_image_text(self, element: Tag, book: EpubBook) -> str:
+        The items of the book are indexed by id and file name the first time
+        the book is seen, instead of scanning every item for each image.
+        Sources are resolved against the chapter's file name first. Without a
+        chapter, sources such as '../Images/cover.jpg' fall back to the path
+        without leading parent directories, then to the bare file name if
+        only one item has it.
+        """
+        if book is not self._indexed_book:
+            items_by_name: dict = {}
+            items_by_basename: dict = {}
+            for item in book.get_items():
+                basename = posixpath.basename(item.file_name)
+                # A file name shared by several items is ambiguous.
+                items_by_basename[basename] = (
+                    None if basename in items_by_basename else item
+                )
+                items_by_name[item.file_name] = item
+                items_by_name[item.id] = item
+            self._items_by_name = items_by_name
+            self._items_by_basename = items_by_basename
+            self._indexed_book = book
+
+        path = unquote(src)
+        if chapter_name:
+            chapter_path = posixpath.normpath(
+                posixpath.join(posixpath.dirname(chapter_name), path)
+            )
+            if item := self._items_by_name.get(chapter_path):
+                return item
+        path = posixpath.normpath(path)
+        while path.startswith("../"):
+            path = path[3:]
+        return (
+            self._items_by_name.get(src)
+            or self._items_by_name.get(path)
+            or self._items_by_basename.get(posixpath.basename(path))
+        )
+
+    def _extract_image_text(
+        self, element: HtmlElement, book: EpubBook, chapter_name: str = ""
+    ) -> str:
         """
         Extracts text from an image element.
 
         Args:
-            element (Tag): The element containing the image data.
+            element (HtmlElement): The element containing the image data.
             book (EpubBook): The EpubBook object for accessing image data.
+            chapter_name (str): The file name of the chapter the element is
+                in.
 
         Returns:
             str: The extracted text from the image.
         """
-        base64_images: list = self._get_image_file(element, book)
+        base64_images: list = self._get_image_file(element, book, chapter_name)
         return run_ocr(base64_images)
 
-    def _extract_text(self, element: Tag) -> str:
-        return element.get_text().strip()
+    def _extract_text(self, element: HtmlElement) -> str:
+        return element.text_content().strip()
@@ -1,16 +1,38 @@
-import base64
+import binascii
+import hashlib
+import mmap
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from typing import Optional, Union
 
 from dotenv import load_dotenv
 from openai import OpenAI
 from openai.types.chat.chat_completion import ChatCompletion
+from PIL import Image
 
 from . import logger
 from ._exceptions import NoResponseError
 
 load_dotenv()
 api_key: str = os.getenv("OPENAI_API_KEY", "")
-CLIENT: OpenAI = OpenAI(api_key=api_key)
+OCR_MAX_WORKERS: int = 8
+# Rate limited and server error responses are retried by the client with
+# exponential backoff, so concurrent batches back off instead of failing.
+OCR_MAX_RETRIES: int = 5
+CLIENT: OpenAI = OpenAI(api_key=api_key, max_retries=OCR_MAX_RETRIES)
+# Refused requests are sent again this many times with the same payload.
+OCR_REFUSAL_RETRIES: int = 3
+OCR_CACHE_SIZE: int = 256
+# Images with fewer pixels than this, such as spacers and ornaments, are too
+# small to hold readable text and are not sent for OCR.
+OCR_MIN_IMAGE_PIXELS: int = 32 * 32
+
+_ocr_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_ocr_cache_lock = threading.Lock()
 
 GPT_REFUSALS = [
     "I'm sorry",
@@ -20,15 +42,41 @@ GPT_REFUSALS = [
 ]
 
 
-def encode_image_bytes(image_bytes: bytes) -> str:
+def encode_image_bytes(image_bytes: Union[bytes, mmap.mmap]) -> str:
     """Encode opened image as base64 string from bytes."""
-    return base64.b64encode(image_bytes).decode("utf-8")
+    return binascii.b2a_base64(image_bytes, newline=False).decode("ascii")
 
 
 def encode_image_file(image_path: str) -> str:
-    """Encode image as base64 string with file path."""
+    """
+    Encode image as base64 string with file path.
+
+    The file is memory mapped and encoded in place, rather than first being
+    read into a copy.
+    """
     with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode("utf-8")
+        if not os.fstat(image_file.fileno()).st_size:
+            return ""
+        with mmap.mmap(
+            image_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as image_map:
+            return encode_image_bytes(image_map)
+
+
+def is_too_small_for_ocr(image_bytes: bytes) -> bool:
+    """
+    Check whether an image is too small to hold readable text.
+
+    Only the image header is read to get its size. Images Pillow cannot
+    identify, or refuses to open because they are too large, are not
+    considered too small.
+    """
+    try:
+        with Image.open(BytesIO(image_bytes)) as image:
+            width, height = image.size
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return False
+    return width * height < OCR_MIN_IMAGE_PIXELS
 
 
 def create_image_role_list(base64_images: list) -> list:
@@ -77,6 +125,39 @@ def clean_response(answer: str) -> str:
     return answer
 
 
+def _ocr_cache_key(base64_images: list) -> bytes:
+    """Hash a list of base64-encoded images into a compact cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for base64_image in base64_images:
+        digest.update(str(base64_image).encode())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _get_cached_ocr(key: bytes) -> Optional[str]:
+    """Return the cached OCR text for the key, if there is one."""
+    with _ocr_cache_lock:
+        text = _ocr_cache.get(key)
+        if text is not None:
+            _ocr_cache.move_to_end(key)
+        return text
+
+
+def _cache_ocr(key: bytes, text: str) -> None:
+    """Store OCR text, evicting the least recently used entry when full."""
+    with _ocr_cache_lock:
+        _ocr_cache[key] = text
+        _ocr_cache.move_to_end(key)
+        if len(_ocr_cache) > OCR_CACHE_SIZE:
+            _ocr_cache.popitem(last=False)
+
+
+def clear_ocr_cache() -> None:
+    """Forget all cached OCR results."""
+    with _ocr_cache_lock:
+        _ocr_cache.clear()
+
+
 def run_ocr(
     base64_images: list, client: OpenAI = CLIENT, retry: int = 0
 ) -> str:
@@ -84,32 +165,65 @@ def run_ocr(
     Perform optical character recognition (OCR) on a list of base64-encoded
     images using the OpenAI API.
 
+    Refusals are retried in a loop with the same payload, up to
+    OCR_REFUSAL_RETRIES times. Results are cached by a hash of the images,
+    so images repeated across a book, such as scene break ornaments, are only
+    sent once.
+
     Arguments:
         base64_images (list): A list of base64-encoded images.
+        retry (int): The number of refusal retries already used.
 
     Returns str: The recognized text from the images.
     """
     if not base64_images:
         logger.info("No images to OCR")
         return ""
+    cache_key: bytes = _ocr_cache_key(base64_images)
+    if (cached_text := _get_cached_ocr(cache_key)) is not None:
+        return cached_text
     payload: list = create_payload(base64_images)
 
     try:
-        response: ChatCompletion = client.chat.completions.create(
-            model="gpt-4o-mini", messages=payload, max_tokens=10
-        )
-        if response.choices and response.choices[0].message.content:
-            answer: str = response.choices[0].message.content
-            if any(refusal in answer for refusal in GPT_REFUSALS):
-                logger.error(f"GPT-4o Mini refusal: {answer}")
-                if retry > 2:
-                    raise NoResponseError("GPT-4o Mini refused: {answer}")
-                return run_ocr(
-                    base64_images=base64_images, client=client, retry=retry + 1
-                )
-            return clean_response(answer)
-        else:
-            raise NoResponseError("No response found")
+        answer: str = ""
+        for _ in range(retry, OCR_REFUSAL_RETRIES + 1):
+            response: ChatCompletion = client.chat.completions.create(
+                model="gpt-4o-mini", messages=payload, max_tokens=10
+            )
+            if not (response.choices and response.choices[0].message.content):
+                raise NoResponseError("No response found")
+            answer = response.choices[0].message.content
+            if not any(refusal in answer for refusal in GPT_REFUSALS):
+                text: str = clean_response(answer)
+                _cache_ocr(cache_key, text)
+                return text
+            logger.error(f"GPT-4o Mini refusal: {answer}")
+        raise NoResponseError(f"GPT-4o Mini refused: {answer}")
     except Exception as e:
         logger.exception("An error occurred %s", str(e))
         return ""
+
+
+def run_ocr_batch(
+    image_batches: list,
+    client: OpenAI = CLIENT,
+    max_workers: int = OCR_MAX_WORKERS,
+) -> list:
+    """
+    Perform OCR on several independent lists of base64-encoded images,
+    sending the requests concurrently instead of one after another.
+
+    Arguments:
+        image_batches (list): A list of lists of base64-encoded images. Each
+            inner list is recognized as one combined statement by `run_ocr`.
+        max_workers (int): The maximum number of concurrent requests.
+
+    Returns list: The recognized text for each list of images, in order.
+    """
+    if len(image_batches) < 2:
+        return [run_ocr(images, client=client) for images in image_batches]
+    workers: int = min(max_workers, len(image_batches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(partial(run_ocr, client=client), image_batches)
+        )
@@ -13,6 +13,9 @@ from ebook2text.pdf_conversion.pdf_line_logic import check_line, compare_lines
 from ebook2text.pdf_conversion.pdf_text_extractor import PDFTextExtractor
 from ebook2text.text_utilities import desmarten_text
 
+NEWLINES_PATTERN = re.compile(r"\n+")
+SPACES_PATTERN = re.compile(r"[ ]{2,}")
+
 
 class PDFConverter:
     """
@@ -148,8 +151,8 @@ class PDFConverter:
     @staticmethod
     def _remove_extra_whitespace(text: str) -> str:
         """Remove extra whitespace from the given text."""
-        text = re.sub(r"\n+", "\n", text)
-        return re.sub(r"[ ]{2,}", " ", text)
+        text = NEWLINES_PATTERN.sub("\n", text)
+        return SPACES_PATTERN.sub(" ", text)
 
     def parse_file(self) -> Generator[str, None, None]:
         """
@@ -184,7 +187,7 @@ class PDFConverter:
         return (
             text
             if output_path.exists()
-            else text.lstrip(self._chapter_separator)
+            else text.removeprefix(self._chapter_separator)
         )
 
     def write_text(self, content: str, output_path: Path) -> None:
@@ -201,6 +204,27 @@ class PDFConverter:
         with output_path.open("a", encoding="utf-8") as f:
             f.write(cleaned_content)
 
+    def write_file(
+        self, generator: Generator[str, None, None], output_path: Path
+    ) -> None:
+        """
+        Write all of the parsed text to a file, opening it only once.
+
+        Args:
+            generator (Generator[str, None, None]): The content generator
+                that yields the text. This is usually the `parse_file` method.
+            output_path (Path): The path to the output file.
+        """
+        is_new_file = not output_path.exists()
+        with output_path.open("a", encoding="utf-8") as f:
+            for content in generator:
+                if not content.strip():
+                    continue
+                if is_new_file:
+                    content = content.removeprefix(self._chapter_separator)
+                    is_new_file = False
+                f.write(content)
+
     def return_string(self, generator: Generator[str, None, None]) -> str:
         """
         Return the parsed text as a string.
@@ -212,6 +236,6 @@ class PDFConverter:
         Returns:
             str: The parsed text as a single string.
         """
-        return "".join(line for line in generator if line.strip()).lstrip(
-            self._chapter_separator
-        )
+        return "".join(
+            line for line in generator if line.strip()
+        ).removeprefix(self._chapter_separator)
@@ -141,7 +141,7 @@ class PDFImageExtractor:
             )
             buffered = BytesIO()
             image.save(buffered, format="PNG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
+            return base64.b64encode(buffered.getvalue()).decode("ascii")
         except ValueError as e:
             logger.exception(
                 f"Failed to create base64 encoded image due to {e}"
@@ -163,7 +163,7 @@ class PDFImageExtractor:
             with BytesIO(jpeg_data) as jpeg, BytesIO() as png:
                 image = Image.open(jpeg)
                 image.save(png, format="PNG")
-                return base64.b64encode(png.getvalue()).decode("utf-8")
+                return base64.b64encode(png.getvalue()).decode("ascii")
         except Exception as e:
             logger.exception(f"Failed to transcode JPEG to PNG: {e}")
             raise
@@ -54,7 +54,7 @@ class TextParser:
         return (
             text
             if output_path.exists()
-            else text.lstrip(self._chapter_separator)
+            else text.removeprefix(self._chapter_separator)
         )
 
     def write_text(self, content: str, output_path: Path) -> None:
@@ -69,6 +69,27 @@ class TextParser:
         with output_path.open("a", encoding="utf-8") as f:
             f.write(cleaned_content + "\n")
 
+    def write_file(
+        self, generator: Generator[str, None, None], output_path: Path
+    ) -> None:
+        """
+        Write all of the parsed text to a file, opening it only once.
+
+        Args:
+            generator (Generator[str, None, None]): The content generator
+                that yields the text. This is usually the `parse_file` method.
+            output_path (Path): The path to the output file.
+        """
+        is_new_file = not output_path.exists()
+        with output_path.open("a", encoding="utf-8") as f:
+            for content in generator:
+                if not content:
+                    continue
+                if is_new_file:
+                    content = content.removeprefix(self._chapter_separator)
+                    is_new_file = False
+                f.write(content + "\n")
+
     def return_string(self, generator: Generator[str, None, None]) -> str:
         """
         Return the parsed text as a string.
@@ -80,6 +101,6 @@ class TextParser:
         Returns:
             str: The parsed text as a single string.
         """
-        return "\n".join(line for line in generator if line.strip()).lstrip(
-            self._chapter_separator
-        )
+        return "\n".join(
+            line for line in generator if line.strip()
+        ).removeprefix(self._chapter_separator)
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 punctuation_map = str.maketrans(
     {
@@ -13,6 +14,14 @@ punctuation_map = str.maketrans(
     }
 )
 
+WHITESPACE_PATTERN = re.compile(r"(\s)+")
+
+
+@lru_cache(maxsize=None)
+def _chapter_break_pattern(chapter_break: str) -> re.Pattern:
+    """Compile the pattern matching runs of the given chapter break once."""
+    return re.compile(f"(?:{re.escape(chapter_break)})+")
+
 
 def desmarten_text(book_content: str, punctuation_map=punctuation_map) -> str:
     """
@@ -36,8 +45,7 @@ def clean_chapter_breaks(full_text: str, chapter_break: str = "***\n") -> str:
     Returns:
         The text with chapter breaks replaced by a single chapter break.
     """
-    escaped_break = re.escape(chapter_break)
-    return re.sub(f"(?:{escaped_break})+", chapter_break, full_text)
+    return _chapter_break_pattern(chapter_break).sub(chapter_break, full_text)
 
 
 def remove_leading_chapter_breaks(
@@ -65,7 +73,7 @@ def remove_whitespace(full_text: str) -> str:
     Returns:
         The text with extra whitespace removed.
     """
-    return re.sub(r"(\s)+", r"\1", full_text.strip())
+    return WHITESPACE_PATTERN.sub(r"\1", full_text.strip())
 
 
 def clean_text(full_text: str) -> str:
@@ -29,9 +29,9 @@ setup(
     author_email="ashlynn@prosepal.io",
     packages=find_packages(),
     install_requires=[
+        "lxml",
         "pdfminer.six",
         "pillow",
-        "beautifulsoup4",
         "python-docx",
         "python-dotenv",
         "openai",
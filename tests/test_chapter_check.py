@@ -1,6 +1,7 @@
 import pytest
 
 from ebook2text.chapter_check import (
+    _is_number_word,
     is_chapter,
     is_not_chapter,
     is_number,
@@ -117,6 +118,11 @@ class TestIsChapter:
     def test_invalid_chapter(self):
         assert not is_chapter("Introduction")
 
+    def test_body_lines_are_not_cached(self):
+        _is_number_word.cache_clear()
+        assert not is_chapter("A long line of body text, never repeated.")
+        assert _is_number_word.cache_info().currsize == 0
+
 
 class TestIsNotChapter:
     def test_title_match(self):
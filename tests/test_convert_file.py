@@ -0,0 +1,50 @@
+import pytest
+
+from ebook2text.convert_file import (
+    _initialize_converter,
+    _parse_file_path,
+    convert_files,
+)
+from ebook2text.text_parser import TextParser
+
+
+def test_convert_files_returns_results_in_order(tmp_path, metadata):
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("First book text.\n")
+    second.write_text("Second book text.\n")
+
+    results = convert_files(
+        [(first, metadata), (second, metadata)],
+        save_file=False,
+        max_workers=2,
+    )
+
+    assert results == ["First book text.", "Second book text."]
+
+
+def test_convert_files_saves_each_book(tmp_path, metadata):
+    book = tmp_path / "my-book.txt"
+    book.write_text("Book text.\n")
+
+    results = convert_files([(book, metadata)], max_workers=1)
+
+    assert results == [None]
+    assert (tmp_path / "my_book.txt").read_text() == "Book text.\n"
+
+
+def test_parse_file_path_replaces_separators(tmp_path):
+    file_path = tmp_path / "my book-title.v2.epub"
+
+    assert _parse_file_path(file_path) == tmp_path / "my_book_title_v2.txt"
+
+
+def test_initialize_converter_unsupported_extension(tmp_path, metadata):
+    with pytest.raises(ValueError):
+        _initialize_converter(tmp_path / "book.rtf", metadata, ".rtf")
+
+
+def test_initialize_converter_text_file(tmp_path, metadata):
+    converter = _initialize_converter(tmp_path / "book.txt", metadata, ".txt")
+
+    assert isinstance(converter, TextParser)
@@ -1,5 +1,8 @@
+from io import BytesIO
+
 import pytest
 from docx import Document  # constructor
+from docx.enum.text import WD_BREAK
 from docx.oxml import parse_xml
 from docx.text.paragraph import Paragraph
 
@@ -90,6 +93,16 @@ def test_read_file(docx_converter):
     assert paragraphs
 
 
+def test_read_file_from_bytes(docx_file, metadata, docx_text_extractor):
+    """Test that a DOCX file already in memory is read the same way."""
+    with open(docx_file, "rb") as f:
+        converter = DocxConverter(f.read(), metadata, docx_text_extractor)
+    paragraphs = list(converter.paragraphs)
+    assert [p.text for p in paragraphs] == [
+        p.text for p in Document(docx_file).paragraphs
+    ]
+
+
 def test_extract_images_with_image(
     docx_image_extractor, docx_paragraph_with_image, expected_base64_image
 ):
@@ -162,17 +175,71 @@ def test_extract_images_from_paragraph_without_images(
     assert blobs == []
 
 
+def test_extract_images_skips_linked_images(docx_image_extractor, mocker):
+    """Test that linked images without an embedded part are skipped quietly"""
+    mock_logger = mocker.patch(
+        "ebook2text.docx_conversion.docx_image_extractor.logger"
+    )
+    mock_paragraph = mocker.Mock()
+    mock_paragraph._p = parse_xml(f"""
+        <w:p xmlns:w="{docx_ns_map["w"]}" xmlns:a="{docx_ns_map["a"]}"
+            xmlns:r="{docx_ns_map["r"]}">
+            <w:r><a:blip r:link="rId9"/></w:r>
+        </w:p>
+    """)
+    assert docx_image_extractor.extract_images(mock_paragraph) == []
+    mock_logger.warning.assert_not_called()
+
+
+def test_index_document_finds_image_paragraphs(
+    docx_image_extractor, docx_file_with_image, expected_base64_image
+):
+    """Test that indexed extraction only finds images where they exist"""
+    doc = Document(docx_file_with_image)
+    docx_image_extractor.index_document(doc.part)
+    paragraphs = doc.paragraphs
+
+    assert docx_image_extractor.extract_images(paragraphs[8]) == [
+        expected_base64_image
+    ]
+    assert docx_image_extractor.extract_images(paragraphs[0]) == []
+
+
+def test_index_document_ignores_other_documents(
+    docx_image_extractor, docx_file_with_image, expected_base64_image
+):
+    """Test that an index does not hide the images of another document"""
+    indexed = Document(docx_file_with_image)
+    docx_image_extractor.index_document(indexed.part)
+    paragraph = Document(docx_file_with_image).paragraphs[8]
+
+    assert docx_image_extractor.has_images(paragraph)
+    assert docx_image_extractor.extract_images(paragraph) == [
+        expected_base64_image
+    ]
+
+
+def test_has_images(
+    docx_image_extractor,
+    docx_paragraph_with_image,
+    docx_paragraph_without_image,
+):
+    """Test the drawing check used before extracting images"""
+    assert docx_image_extractor.has_images(docx_paragraph_with_image)
+    assert not docx_image_extractor.has_images(docx_paragraph_without_image)
+
+
 def test_missing_embed_attribute(
     docx_image_extractor, docx_paragraph_with_image, mocker
 ):
     """Test handling of missing embed attribute in blip"""
-    mock_findall = mocker.patch.object(docx_paragraph_with_image._p, "findall")
+    mock_iter = mocker.patch.object(docx_paragraph_with_image._p, "iter")
     # Create a malformed blip without embed attribute
     blip = parse_xml("""
         <a:blip xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
         </a:blip>
     """)
-    mock_findall.return_value = [blip]
+    mock_iter.return_value = [blip]
     blobs = docx_image_extractor._extract_image_blobs(
         docx_paragraph_with_image
     )
@@ -184,9 +251,9 @@ def test_invalid_relationship_id(docx_image_extractor, mocker):
     mock_paragraph = mocker.Mock()
 
     mock_blip = mocker.Mock()
-    mock_blip.attrib = {f"{{{docx_ns_map['r']}}}embed": "rId123"}
+    mock_blip.get = {f"{{{docx_ns_map['r']}}}embed": "rId123"}.get
     mock_paragraph._p = mocker.Mock()
-    mock_paragraph._p.findall.return_value = [mock_blip]
+    mock_paragraph._p.iter.return_value = [mock_blip]
 
     mock_part = mocker.Mock()
     mock_part.related_parts = {}
@@ -200,7 +267,7 @@ def test_malformed_paragraph_structure(docx_image_extractor, mocker):
     """Test handling of malformed paragraph structure"""
     mock_paragraph = mocker.Mock()
     mock_paragraph._p = mocker.Mock()
-    mock_paragraph._p.findall.return_value = []
+    mock_paragraph._p.iter.return_value = []
     mock_paragraph.part = None
     blobs = docx_image_extractor._extract_image_blobs(mock_paragraph)
     assert blobs == []
@@ -212,14 +279,14 @@ def test_corrupted_image_data(docx_image_extractor, mocker):
 
     mock_blip_valid = mocker.Mock()
     rId_valid = "rId123"
-    mock_blip_valid.attrib = {f"{{{docx_ns_map['r']}}}embed": rId_valid}
+    mock_blip_valid.get = {f"{{{docx_ns_map['r']}}}embed": rId_valid}.get
 
     mock_blip_corrupt = mocker.Mock()
     rId_corrupt = "rIdCorrupt"
-    mock_blip_corrupt.attrib = {f"{{{docx_ns_map['r']}}}embed": rId_corrupt}
+    mock_blip_corrupt.get = {f"{{{docx_ns_map['r']}}}embed": rId_corrupt}.get
 
     mock_paragraph._p = mocker.Mock()
-    mock_paragraph._p.findall.return_value = [
+    mock_paragraph._p.iter.return_value = [
         mock_blip_valid,
         mock_blip_corrupt,
     ]
@@ -243,3 +310,161 @@ def test_corrupted_image_data(docx_image_extractor, mocker):
     print("Extracted blobs:", blobs)
     assert len(blobs) == 1, f"Unexpected blobs: {blobs}"
     assert blobs[0] == b"valid_image_data"
+
+
+def test_extract_texts_runs_ocr_only_for_images(
+    docx_text_extractor,
+    docx_paragraph_with_image,
+    docx_paragraph_without_image,
+    mocker,
+):
+    """Test that OCR text replaces only the paragraphs that have images"""
+    mock_batch = mocker.patch(
+        "ebook2text.docx_conversion.docx_text_extractor.run_ocr_batch",
+        return_value=["Chapter One"],
+    )
+    texts = docx_text_extractor.extract_texts(
+        [docx_paragraph_without_image, docx_paragraph_with_image]
+    )
+
+    assert texts == [docx_paragraph_without_image.text.strip(), "Chapter One"]
+    assert len(mock_batch.call_args.args[0]) == 1
+
+
+def test_extract_text_empty_paragraph(docx_text_extractor):
+    """Test that a paragraph with no text or images extracts as empty"""
+    paragraph = Paragraph(
+        parse_xml(f"""
+            <w:p xmlns:w="{docx_ns_map["w"]}">
+                <w:r><w:tab/></w:r>
+            </w:p>
+        """),
+        None,
+    )
+    assert docx_text_extractor.extract_text(paragraph) == ""
+
+
+def test_contains_page_break(docx_converter, mocker):
+    """Test that a paragraph with pageBreakBefore is detected as a break"""
+    mock_paragraph = mocker.Mock()
+    mock_paragraph._element = parse_xml(f"""
+        <w:p xmlns:w="{docx_ns_map["w"]}">
+            <w:pPr><w:pageBreakBefore/></w:pPr>
+        </w:p>
+    """)
+    assert docx_converter._contains_page_break(mock_paragraph)
+
+
+def test_contains_manual_page_break(docx_converter, mocker):
+    """Test that a run with a page break is detected as a break"""
+    mock_paragraph = mocker.Mock()
+    mock_paragraph._element = parse_xml(f"""
+        <w:p xmlns:w="{docx_ns_map["w"]}">
+            <w:r><w:br w:type="page"/></w:r>
+        </w:p>
+    """)
+    assert docx_converter._contains_page_break(mock_paragraph)
+
+
+def test_does_not_contain_page_break(docx_converter, mocker):
+    """Test that a plain paragraph is not detected as a page break"""
+    mock_paragraph = mocker.Mock()
+    mock_paragraph._element = parse_xml(f"""
+        <w:p xmlns:w="{docx_ns_map["w"]}">
+            <w:r><w:t>Text</w:t></w:r>
+        </w:p>
+    """)
+    assert not docx_converter._contains_page_break(mock_paragraph)
+
+
+def test_page_breaks_before_and_after_text(docx_converter, mocker):
+    """Test that a page break is placed relative to the paragraph text"""
+    mock_paragraph = mocker.Mock()
+    mock_paragraph._element = parse_xml(f"""
+        <w:p xmlns:w="{docx_ns_map["w"]}">
+            <w:r><w:t>Last line.</w:t><w:br w:type="page"/></w:r>
+        </w:p>
+    """)
+    assert docx_converter._page_breaks(mock_paragraph) == (False, True)
+    mock_paragraph._element = parse_xml(f"""
+        <w:p xmlns:w="{docx_ns_map["w"]}">
+            <w:r><w:br w:type="page"/><w:t>First line.</w:t></w:r>
+        </w:p>
+    """)
+    assert docx_converter._page_breaks(mock_paragraph) == (True, False)
+
+
+@pytest.fixture
+def docx_bytes_with_trailing_page_break():
+    """A document whose chapter ends with a Ctrl+Enter page break"""
+    document = Document()
+    document.add_paragraph("Chapter 1")
+    document.add_paragraph("Body of chapter one.")
+    last_line = document.add_paragraph("Last line of chapter one.")
+    last_line.add_run().add_break(WD_BREAK.PAGE)
+    document.add_paragraph("Chapter 2")
+    document.add_paragraph("Body of chapter two.")
+    stream = BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+def test_parse_file_trailing_page_break(
+    docx_bytes_with_trailing_page_break, metadata, docx_text_extractor
+):
+    """Test that text before a page break stays on the page it ends"""
+    converter = DocxConverter(
+        docx_bytes_with_trailing_page_break, metadata, docx_text_extractor
+    )
+    assert list(converter.parse_file()) == [
+        "***\nBody of chapter one.\nLast line of chapter one.",
+        "***\nBody of chapter two.",
+    ]
+
+
+def test_process_text_chapter_start(docx_converter):
+    """Test that a chapter header becomes a separator and resets the index"""
+    docx_converter.non_chapter = True
+    processed_text, index = docx_converter._process_text("Chapter 1", 2)
+    assert processed_text == docx_converter._chapter_separator
+    assert index == 0
+    assert not docx_converter.non_chapter
+
+
+def test_process_text_non_chapter(docx_converter):
+    """Test that front matter is dropped along with the text that follows"""
+    assert docx_converter._process_text("Introduction", 1) == ("", 1)
+    assert docx_converter._process_text("Body text.", 2) == ("", 2)
+
+
+def test_process_text_outside_header_window(docx_converter):
+    """Test that chapter headers are ignored past the header window"""
+    index = docx_converter._max_lines_to_check
+    processed_text, new_index = docx_converter._process_text(
+        "Chapter 1", index
+    )
+    assert processed_text == "Chapter 1"
+    assert new_index == index
+
+
+def test_write_text_strips_separator_only_on_first_write(
+    docx_converter, tmp_path
+):
+    """Test that only the first page written loses its chapter separator"""
+    output_path = tmp_path / "output.txt"
+    docx_converter.write_text("***\nChapter text", output_path)
+    docx_converter.write_text("***\nMore text", output_path)
+    assert output_path.read_text(encoding="utf-8") == (
+        "\nChapter text\n***\nMore text\n"
+    )
+
+
+def test_write_text_strips_separator_for_each_new_file(
+    docx_converter, tmp_path
+):
+    """Test that a second output file also loses its leading separator"""
+    first_path = tmp_path / "first.txt"
+    second_path = tmp_path / "second.txt"
+    docx_converter.write_text("***\nChapter text", first_path)
+    docx_converter.write_text("***\nChapter text", second_path)
+    assert second_path.read_text(encoding="utf-8") == "\nChapter text\n"
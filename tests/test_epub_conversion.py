@@ -1,5 +1,7 @@
+import zipfile
+
+import lxml.html
 import pytest
-from bs4 import BeautifulSoup
 
 from ebook2text.epub_conversion import EpubConverter, EpubTextExtractor
 
@@ -17,15 +19,15 @@ def epub_file_with_image(test_files_dir):
 @pytest.fixture
 def sample_element_with_text():
     html = "<div><p>This is a sample paragraph.</p></div>"
-    soup = BeautifulSoup(html, "html.parser")
-    return soup.find("p")
+    root = lxml.html.fromstring(html)
+    return next(root.iter("p"))
 
 
 @pytest.fixture
 def sample_element_with_image():
     html = '<img src="chapter_one.jpg"/>'
-    soup = BeautifulSoup(html, "html.parser")
-    return soup.find("img")
+    root = lxml.html.fromstring(html)
+    return next(root.iter("img"))
 
 
 @pytest.fixture
@@ -52,6 +54,24 @@ class TestEpubConverter:
         assert all(isinstance(chapter, str) for chapter in chapters)
         assert all(len(chapter.strip()) > 0 for chapter in chapters)
 
+    def test_parse_file_threaded_matches_parse_file(
+        self, epub_file, metadata, epub_text_extractor
+    ):
+        threaded = EpubConverter(epub_file, metadata, epub_text_extractor)
+        serial = EpubConverter(epub_file, metadata, epub_text_extractor)
+        assert list(threaded.parse_file_threaded(max_workers=2)) == list(
+            serial.parse_file()
+        )
+
+    def test_read_unpacked_epub_directory(
+        self, epub_file, metadata, epub_text_extractor, tmp_path
+    ):
+        with zipfile.ZipFile(epub_file) as archive:
+            archive.extractall(tmp_path)
+        unpacked = EpubConverter(tmp_path, metadata, epub_text_extractor)
+        packed = EpubConverter(epub_file, metadata, epub_text_extractor)
+        assert list(unpacked.parse_file()) == list(packed.parse_file())
+
     def test_process_chapter_text_extracts_content(
         self, epub_converter, epub_file
     ):
@@ -60,6 +80,42 @@ class TestEpubConverter:
         assert isinstance(text, str)
         assert text == "First chapter paragraph text."
 
+    def test_process_chapter_text_skips_images_in_body(
+        self, epub_converter, mocker
+    ):
+        item = mocker.Mock()
+        item.content = (
+            b"<html><body><h1>Chapter 1</h1><p>First.</p>"
+            b'<img src="image.png"/><p>Second.</p></body></html>'
+        )
+        text = epub_converter._process_chapter_text(item)
+        assert text == "First.\nSecond."
+
+    @pytest.mark.parametrize(
+        "declaration,encoding",
+        [
+            ("", "utf-8"),
+            ("", "utf-16"),
+            ('<?xml version="1.0" encoding="utf-8"?>', "utf-8"),
+            ('<?xml version="1.0" encoding="iso-8859-1"?>', "iso-8859-1"),
+        ],
+    )
+    def test_process_chapter_text_decodes_non_ascii(
+        self, epub_converter, mocker, declaration, encoding
+    ):
+        item = mocker.Mock()
+        item.content = (
+            f"{declaration}<html><body><h1>Chapter 1</h1>"
+            "<p>Déjà vu at the café</p></body></html>"
+        ).encode(encoding)
+        text = epub_converter._process_chapter_text(item)
+        assert text == "Déjà vu at the café"
+
+    def test_process_chapter_text_empty_item(self, epub_converter, mocker):
+        item = mocker.Mock()
+        item.content = b""
+        assert epub_converter._process_chapter_text(item) == ""
+
     def test_return_string_with_separators(self, epub_converter):
         chapters = list(epub_converter.parse_file())
         result_string = epub_converter.return_string(chapters)
@@ -83,6 +139,18 @@ class TestEpubConverter:
         expected_content = f"\n***\n{content}"
         assert written_content == expected_content
 
+    def test_write_file_with_chapter_separators(
+        self, epub_converter, tmp_path
+    ):
+        chapters = ["Chapter one text.", "", "Chapter two text."]
+        file_path = tmp_path / "output.txt"
+
+        epub_converter.write_file(iter(chapters), file_path)
+        with file_path.open("r", encoding="utf-8") as f:
+            written_content = f.read()
+        expected_content = "\n***\nChapter one text.\n***\nChapter two text."
+        assert written_content == expected_content
+
 
 class TestEpubTextExtractor:
     def test_extract_text_from_regular_element(
@@ -105,8 +173,8 @@ class TestEpubTextExtractor:
         epub_book = epub_converter_with_image.epub_book
         element = sample_element_with_image
         print(element.get("src"))
-        print(element.name)
-        for key, value in element.attrs.items():
+        print(element.tag)
+        for key, value in element.attrib.items():
             print(key, value)
         result = epub_text_extractor.extract_text(
             sample_element_with_image, epub_book
@@ -114,17 +182,46 @@ class TestEpubTextExtractor:
         assert isinstance(result, str)
         assert result == "Chapter One"
 
+    def test_extract_text_from_chapter_relative_image(
+        self, epub_converter_with_image, epub_text_extractor, mocker
+    ):
+        mock_ocr = mocker.patch(
+            "ebook2text.epub_conversion.epub_text_extractor.run_ocr",
+            return_value="Chapter One",
+        )
+        root = lxml.html.fromstring('<img src="../Images/chapter_one.jpg"/>')
+        result = epub_text_extractor.extract_text(
+            next(root.iter("img")), epub_converter_with_image.epub_book
+        )
+        assert result == "Chapter One"
+        assert len(mock_ocr.call_args.args[0]) == 1
+
+    def test_find_item_resolves_against_chapter(
+        self, epub_text_extractor, mocker
+    ):
+        images = mocker.Mock(file_name="Images/fig1.png", id="image")
+        text = mocker.Mock(file_name="Text/fig1.png", id="text")
+        book = mocker.Mock()
+        book.get_items.return_value = [images, text]
+
+        find_item = epub_text_extractor._find_item
+        assert (
+            find_item("../Images/fig1.png", book, "Text/ch1.xhtml") is images
+        )
+        assert find_item("fig1.png", book, "Text/ch1.xhtml") is text
+        assert find_item("fig1.png", book) is None
+
     def test_extract_text_from_empty_element(self, epub_text_extractor):
         html = "<div></div>"
-        soup = BeautifulSoup(html, "html.parser")
-        empty_element = soup.find("div")
+        root = lxml.html.fromstring(html)
+        empty_element = next(root.iter("div"))
         result = epub_text_extractor.extract_text(empty_element)
         assert result == ""
 
     def test_extract_text_from_whitespace_element(self, epub_text_extractor):
         html = "<p>    </p>"
-        soup = BeautifulSoup(html, "html.parser")
-        whitespace_element = soup.find("p")
+        root = lxml.html.fromstring(html)
+        whitespace_element = next(root.iter("p"))
         result = epub_text_extractor.extract_text(whitespace_element)
         assert result == ""
 
@@ -132,7 +229,7 @@ class TestEpubTextExtractor:
         self, epub_text_extractor
     ):
         html = "<div><p>This is a <strong>sample</strong> paragraph with <em>nested</em> elements.</p></div>"
-        soup = BeautifulSoup(html, "html.parser")
-        element = soup.find("p")
+        root = lxml.html.fromstring(html)
+        element = next(root.iter("p"))
         result = epub_text_extractor.extract_text(element)
         assert result == "This is a sample paragraph with nested elements."
@@ -1,3 +1,5 @@
+import struct
+import zlib
 from pathlib import Path
 
 import pytest
@@ -5,11 +7,14 @@ from PIL import Image
 
 from ebook2text.ocr import (
     clean_response,
+    clear_ocr_cache,
     create_image_role_list,
     create_payload,
     encode_image_bytes,
     encode_image_file,
+    is_too_small_for_ocr,
     run_ocr,
+    run_ocr_batch,
 )
 
 
@@ -22,7 +27,9 @@ def base64_images():
 
 @pytest.fixture
 def api_client_mock(mocker):
+    clear_ocr_cache()
     yield mocker.patch("ebook2text.ocr.CLIENT.chat.completions.create")
+    clear_ocr_cache()
 
 
 @pytest.fixture
@@ -51,6 +58,38 @@ def test_encode_image_file(saved_image):
     )
 
 
+def test_encode_image_file_empty(tmp_path):
+    empty_image = tmp_path / "empty.png"
+    empty_image.touch()
+    assert encode_image_file(str(empty_image)) == ""
+
+
+def test_is_too_small_for_ocr(saved_image):
+    with open(saved_image, "rb") as image_file:
+        assert is_too_small_for_ocr(image_file.read())
+    test_file_path = Path(__file__).parent / "test_files" / "chapter_one.jpg"
+    assert not is_too_small_for_ocr(test_file_path.read_bytes())
+    assert not is_too_small_for_ocr(b"not an image")
+
+
+def test_is_too_small_for_ocr_huge_image():
+    def png_chunk(chunk_type, data):
+        return (
+            struct.pack(">I", len(data))
+            + chunk_type
+            + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data))
+        )
+
+    header = struct.pack(">IIBBBBB", 20000, 20000, 8, 0, 0, 0, 0)
+    png = (
+        b"\x89PNG\r\n\x1a\n"
+        + png_chunk(b"IHDR", header)
+        + png_chunk(b"IEND", b"")
+    )
+    assert not is_too_small_for_ocr(png)
+
+
 def test_create_image_role_list(base64_images):
     role_list = create_image_role_list(base64_images)
     assert isinstance(role_list, list)
@@ -110,6 +149,19 @@ def test_run_ocr_single_image(api_client_mock, base64_images, mocker):
     api_client_mock.assert_called_once()
 
 
+def test_run_ocr_caches_repeated_images(
+    api_client_mock, base64_images, mocker
+):
+    api_client_mock.return_value = mocker.MagicMock(
+        choices=[
+            mocker.MagicMock(message=mocker.MagicMock(content="Detected text"))
+        ]
+    )
+    assert run_ocr(base64_images) == "Detected text"
+    assert run_ocr(list(base64_images)) == "Detected text"
+    api_client_mock.assert_called_once()
+
+
 def test_run_ocr_no_response_error(api_client_mock, base64_images, mocker):
     api_client_mock.return_value = mocker.MagicMock(choices=[None])
     result = run_ocr(base64_images)
@@ -130,8 +182,43 @@ def test_run_ocr_refusal(api_client_mock, base64_images, mocker):
     assert api_client_mock.call_count == 4  # due to retries
 
 
+def test_run_ocr_refusal_then_answer(api_client_mock, base64_images, mocker):
+    api_client_mock.side_effect = [
+        mocker.MagicMock(
+            choices=[mocker.MagicMock(message=mocker.MagicMock(content=text))]
+        )
+        for text in ("I'm sorry, I cannot do that", "Chapter One")
+    ]
+    result = run_ocr(base64_images)
+    assert result == "Chapter One"
+    first_call, second_call = api_client_mock.call_args_list
+    assert first_call.kwargs["messages"] is second_call.kwargs["messages"]
+
+
 def test_run_ocr_no_response_exception(api_client_mock, base64_images):
     api_client_mock.side_effect = Exception("Some error")
     result = run_ocr(base64_images)
     assert result == ""
     api_client_mock.assert_called_once()
+
+
+def test_run_ocr_batch_preserves_order(api_client_mock, mocker):
+    def respond(messages, **kwargs):
+        url = messages[0]["content"][1]["image_url"]["url"]
+        return mocker.MagicMock(
+            choices=[
+                mocker.MagicMock(
+                    message=mocker.MagicMock(content=f"Text {url[-1]}")
+                )
+            ]
+        )
+
+    api_client_mock.side_effect = respond
+    result = run_ocr_batch([["image1"], ["image2"], ["image3"]])
+    assert result == ["Text 1", "Text 2", "Text 3"]
+    assert api_client_mock.call_count == 3
+
+
+def test_run_ocr_batch_empty(api_client_mock):
+    assert run_ocr_batch([]) == []
+    api_client_mock.assert_not_called()
@@ -60,3 +60,23 @@ class TestTextParser:
 
         with pytest.raises(TextConversionError):
             list(parser.parse_file())
+
+    def test_write_file_writes_all_content_once(self, tmp_path):
+        test_file = tmp_path / "test.txt"
+        parser = TextParser(test_file)
+
+        parser.write_file(iter(["***line1", "", "line2"]), test_file)
+
+        with test_file.open("r", encoding="utf-8") as f:
+            result = f.read()
+        assert result == "line1\nline2\n"
+
+    def test_write_file_only_removes_separator_prefix(self, tmp_path):
+        test_file = tmp_path / "test.txt"
+        parser = TextParser(test_file)
+
+        parser.write_file(iter(["*****bold** line1", "line2"]), test_file)
+
+        with test_file.open("r", encoding="utf-8") as f:
+            result = f.read()
+        assert result == "**bold** line1\nline2\n"